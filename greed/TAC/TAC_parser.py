@@ -2,6 +2,7 @@ import itertools
 import json
 import logging
 import os
+import sys
 from ast import literal_eval
 from collections import defaultdict
 from typing import Dict, List, Mapping, Tuple
@@ -56,6 +57,16 @@ class TAC_parser:
             return int(stmt_id.split('0x')[1].split('S')[0], base=16)
         else:
             return int(stmt_id.split('0x')[1], base=16)
+
+    @staticmethod
+    def var_name(raw_var: str) -> str:
+        """
+        Translate a Gigahorse variable (e.g., 0x123) to the name of its register (e.g., v123).
+
+        Register names are interned, so that every statement shares the same string object
+        and register lookups can short-circuit on identity.
+        """
+        return sys.intern('v' + raw_var.replace('0x', ''))
         
 
     def parse_statements(self) -> Dict[str, TAC_Statement]:
@@ -67,7 +78,7 @@ class TAC_parser:
         self.statement_to_blocks_map = load_csv_multimap(f"{self.target_dir}/TAC_OriginalStatement_Block.csv")
 
         tac_variable_value = load_csv_map(f"{self.target_dir}/TAC_Variable_Value.csv")
-        tac_variable_value = {'v' + v.replace('0x', ''): val for v, val in tac_variable_value.items()}
+        tac_variable_value = {TAC_parser.var_name(v): val for v, val in tac_variable_value.items()}
 
         tac_defs: Mapping[str, List[Tuple[str, int]]] = defaultdict(list)
         for stmt_id, var, pos in load_csv(f"{self.target_dir}/TAC_Def.csv"):
@@ -108,8 +119,8 @@ class TAC_parser:
                 opcode = tac_op[stmt_id]
                 raw_uses = [var for var, _ in sorted(tac_uses[stmt_id], key=lambda x: x[1])]
                 raw_defs = [var for var, _ in sorted(tac_defs[stmt_id], key=lambda x: x[1])]
-                uses = ['v' + v.replace('0x', '') for v in raw_uses]
-                defs = ['v' + v.replace('0x', '') for v in raw_defs]
+                uses = [TAC_parser.var_name(v) for v in raw_uses]
+                defs = [TAC_parser.var_name(v) for v in raw_defs]
                 values = {v: tac_variable_value.get(v, None) for v in uses + defs}
                 OpcodeClass = tac_opcode_to_class_map[opcode]
                 statement = OpcodeClass(block_id=block_id, stmt_id=stmt_id, uses=uses, defs=defs, values=values)
@@ -244,9 +255,8 @@ class TAC_parser:
                 b.function = function
 
         # rewrite aliases according to PHI map
-        translate_alias = lambda alias: 'v' + alias.replace('0x', '')
         for function in functions.values():
-            function.arguments = [self.phimap.get(translate_alias(a), translate_alias(a)) for a in function.arguments]
+            function.arguments = [self.phimap.get(TAC_parser.var_name(a), TAC_parser.var_name(a)) for a in function.arguments]
 
         return functions
     
@@ -256,7 +266,7 @@ class TAC_parser:
     
     def parse_induction_variables(self):
         induction_variables = load_csv_multimap(f"{self.target_dir}/InductionVariable.csv", reverse=True)
-        induction_variables = {x: {self.phimap.get('v' + _y.replace('0x', ''), 'v' + _y.replace('0x', '')) for _y in y}
+        induction_variables = {x: {self.phimap.get(TAC_parser.var_name(_y), TAC_parser.var_name(_y)) for _y in y}
                                for x, y in induction_variables.items()}
         return induction_variables
     
@@ -265,7 +275,7 @@ class TAC_parser:
         starts_at_const = defaultdict(dict)
         for _x, _y, _z in values:
             y = _y[1:-1].split(", ")[1]
-            y = 'v' + y.replace('0x', '')
+            y = TAC_parser.var_name(y)
             y = self.phimap.get(y, y)
             starts_at_const[_x][y] = literal_eval(_z) # seems to not have a consistent base (either 10 or 16)
         return starts_at_const
@@ -275,7 +285,7 @@ class TAC_parser:
         increases_by_const = defaultdict(dict)
         for _x, _y, _z in values:
             y = _y[1:-1].split(", ")[1]
-            y = 'v' + y.replace('0x', '')
+            y = TAC_parser.var_name(y)
             y = self.phimap.get(y, y)
             increases_by_const[_x][y] = literal_eval(_z) # seems to not have a consistent base (either 10 or 16)
         return increases_by_const
@@ -285,9 +295,9 @@ class TAC_parser:
         upper_bounds = defaultdict(dict)
         for _x, _y, _z in values:
             y = _y[1:-1].split(", ")[1]
-            y = 'v' + y.replace('0x', '')
+            y = TAC_parser.var_name(y)
             y = self.phimap.get(y, y)
-            upper_bounds[_x][y] = self.phimap.get('v' + _z.replace('0x', ''), 'v' + _z.replace('0x', ''))
+            upper_bounds[_x][y] = self.phimap.get(TAC_parser.var_name(_z), TAC_parser.var_name(_z))
         return upper_bounds
 
     def parse_guarding_slots(self):
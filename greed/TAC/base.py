@@ -94,22 +94,23 @@ class TAC_Statement(Aliased):
         # keep a copy of the arg_vals (for set_arg_val)
         self.raw_arg_vals = dict(self.arg_vals)
 
+        # bind the names of the arg vals aliases once (for set_arg_val/reset_arg_val)
+        self._arg_val_attrs = tuple("arg{}_val".format(i + 1) for i in range(self.num_args))
+
     def reset_arg_val(self):
         # IMPORTANT: we need to reset this every time we re-execute this statement or we'll have the old registers
         # values in self.arg_vals (as set by this function)
         self.arg_vals = dict(self.raw_arg_vals)
-        for i in range(self.num_args):
-            var = self.arg_vars[i]
+        for var, arg_val_attr in zip(self.arg_vars, self._arg_val_attrs):
             arg_val = self.arg_vals[var]
-            object.__setattr__(self, "arg{}_val".format(i + 1), arg_val)
+            object.__setattr__(self, arg_val_attr, arg_val)
 
     def set_arg_val(self, state: SymbolicEVMState):
         # IMPORTANT: we need to reset this every time we re-execute this statement or we'll have the old registers
         # values in self.arg_vals (as set by this function)
         self.arg_vals = dict(self.raw_arg_vals)
 
-        for i in range(self.num_args):
-            var = self.arg_vars[i]
+        for var, arg_val_attr in zip(self.arg_vars, self._arg_val_attrs):
             arg_val = self.arg_vals[var]
             # todo: the fact that we are reading the original state's registers here (not succ) could cause issues e.g.,
             # if we need some kind of translation
@@ -122,7 +123,7 @@ class TAC_Statement(Aliased):
             val = state.registers.get(var, None) if arg_val is None else arg_val
             state.registers[var] = val
             self.arg_vals[var] = val
-            object.__setattr__(self, "arg{}_val".format(i + 1), val)
+            object.__setattr__(self, arg_val_attr, val)
 
         # args = {k:bv_unsigned_value(v) if v and is_concrete(v) else '<SYMBOL>' for k, v in self.arg_vals.items()}
         # ress = {k:bv_unsigned_value(v) if v and is_concrete(v) else '<SYMBOL>' for k, v in self.res_vals.items()}
@@ -137,8 +138,11 @@ class TAC_Statement(Aliased):
 
         @functools.wraps(func)
         def wrap(self, state: SymbolicEVMState):
-            self.set_arg_val(state)
-            state.trace.append(state.curr_stmt)
+            # statements without args have nothing to bind (or reset)
+            has_args = self.num_args > 0
+            if has_args:
+                self.set_arg_val(state)
+            state.trace.append(self)
             state.instruction_count += 1
 
             # If we already have all the results from the Gigahorse IR, just use it.
@@ -151,12 +155,14 @@ class TAC_Statement(Aliased):
 
                 succ.set_next_pc()
 
-                self.reset_arg_val()
-                return [succ]
+                if has_args:
+                    self.reset_arg_val()
+                return succ.self_list
 
             # otherwise, execute the actual handler
             successors = func(self, state)
-            self.reset_arg_val()
+            if has_args:
+                self.reset_arg_val()
             return successors
 
         return wrap
@@ -170,13 +176,17 @@ class TAC_Statement(Aliased):
 
         @functools.wraps(func)
         def wrap(self, state: SymbolicEVMState):
-            self.set_arg_val(state)
-            state.trace.append(state.curr_stmt)
+            # statements without args have nothing to bind (or reset)
+            has_args = self.num_args > 0
+            if has_args:
+                self.set_arg_val(state)
+            state.trace.append(self)
             state.instruction_count += 1
 
             # always execute the actual handler because we need the side-effects
             successors = func(self, state)
-            self.reset_arg_val()
+            if has_args:
+                self.reset_arg_val()
             return successors
 
         return wrap
@@ -191,6 +201,7 @@ class TAC_Statement(Aliased):
         _copy.res_vals = {alias_arg_map.get(var, var): val for var, val in self.res_vals.items()}
         _copy.num_args = len(_copy.arg_vars)
         _copy.raw_arg_vals = dict(_copy.arg_vals)
+        _copy._arg_val_attrs = tuple(f"arg{i+1}_val" for i in range(_copy.num_args))
 
         for i, _ in enumerate(_copy.arg_vars):
             var = _copy.arg_vars[i]
@@ -1,10 +1,14 @@
 import logging
+from typing import TYPE_CHECKING
 
 from greed.TAC.base import TAC_Statement
 from greed.solver.shortcuts import *
 from greed.state import SymbolicEVMState
 from greed.utils.exceptions import VMNoSuccessors
 
+if TYPE_CHECKING:
+    from greed.project import Project
+
 __all__ = ['TAC_Throw', 'TAC_Callprivate', 'TAC_Returnprivate', 'TAC_Phi', 'TAC_Const', 'TAC_Nop']
 
 log = logging.getLogger(__name__)
@@ -19,29 +23,40 @@ class TAC_Throw(TAC_Statement):
     @TAC_Statement.handler_with_side_effects
     def handle(self, state: SymbolicEVMState):
         state.halt = True
-        return [state]
+        return state.self_list
 
 
 class TAC_Callprivate(TAC_Statement):
     __internal_name__ = "CALLPRIVATE"
     __aliases__ = {}
 
-    @TAC_Statement.handler_with_side_effects
-    def handle(self, state: SymbolicEVMState):
+    # call target, return pc and arg-alias pairs of the statements whose target is static,
+    # resolved once when loading the project and reused afterwards
+    _static_call = None
+
+    def _resolve_call(self, project: "Project", warn_invalid_args: bool = True):
+        """
+        Resolve the call target, return pc and arg-alias pairs of this CALLPRIVATE, given the current target (arg1_val).
+        Args:
+            project: The project the statement belongs to
+            warn_invalid_args: Whether to warn if the arguments do not match the ones of the target function
+        Returns:
+            The destination pc, the stack frame to push and the (alias, arg) pairs to copy
+        """
         # read target
         target_bb_id = hex(bv_unsigned_value(self.arg1_val))
-        target_bb = state.project.factory.block(target_bb_id)
+        target_bb = project.factory.block(target_bb_id)
 
         try:
-            saved_return_pc = state.get_fallthrough_pc()
+            saved_return_pc = project.factory.block(self.block_id).fallthrough_block().first_ins.id
         except VMNoSuccessors:
-            fake_exit_bb = state.project.factory.block('fake_exit')
+            fake_exit_bb = project.factory.block('fake_exit')
             saved_return_pc = fake_exit_bb.statements[0].id
 
         # read arg-alias map
         args = self.arg_vars[1:]
         args_alias = target_bb.function.arguments
-        if len(args) != len(args_alias):
+        if len(args) != len(args_alias) and warn_invalid_args:
             # NOTE: if just the saved return pc is missing, we can handle that since we keep the callstack
             log.warning("Invalid CALLPRIVATE arguments")
 
@@ -49,35 +64,66 @@ class TAC_Callprivate(TAC_Statement):
         # If the registers that remain unset are never used, the execution will succeed
         # Otherwise, the execution will fail with "uninitialized variable"
         alias_arg_map = dict(zip(args_alias, args))
-        for alias, arg in alias_arg_map.items():
-            state.registers[alias] = state.registers[arg]
 
-        # read destination
         dest = target_bb.first_ins.id
-        state.callstack.append((state.pc, saved_return_pc, self.res_vars))
+        # (callprivate pc, saved return pc, return vars)
+        callstack_frame = (self.id, saved_return_pc, self.res_vars)
+        # NOTE: after the PHI rewrite an alias can be the very same register as its arg, nothing to move then
+        arg_alias_pairs = tuple((alias, arg) for alias, arg in alias_arg_map.items() if alias != arg)
+
+        return dest, callstack_frame, arg_alias_pairs
+
+    def resolve_static_call(self, project: "Project"):
+        """
+        Resolve and cache the call of this CALLPRIVATE, its target (arg1_val) must be static.
+        Args:
+            project: The project the statement belongs to
+        """
+        # NOTE: argument mismatches are reported by sanity_check
+        self._static_call = self._resolve_call(project, warn_invalid_args=False)
+
+    @TAC_Statement.handler_with_side_effects
+    def handle(self, state: SymbolicEVMState):
+        resolved_call = self._static_call
+        if resolved_call is None:
+            # the target is read from the registers of this state, it cannot be cached
+            resolved_call = self._resolve_call(state.project)
+        dest, callstack_frame, arg_alias_pairs = resolved_call
+
+        registers = state.registers
+        for alias, arg in arg_alias_pairs:
+            registers[alias] = registers[arg]
+
+        state.callstack.append(callstack_frame)
 
         # jump to target
         state.pc = dest
-        return [state]
+        return state.self_list
 
 
 class TAC_Returnprivate(TAC_Statement):
     __internal_name__ = "RETURNPRIVATE"
     __aliases__ = {}
 
+    # returned args are static for a given statement, bound on first execution
+    _returnprivate_args = None
+
     @TAC_Statement.handler_with_side_effects
     def handle(self, state: SymbolicEVMState):
         # pop stack frame (read callprivate pc from stack)
         callprivate_pc, saved_return_pc, callprivate_return_vars = state.callstack.pop()
 
+        if self._returnprivate_args is None:
+            self._returnprivate_args = tuple(self.arg_vars[1:])
+
         # set the return variables to their correct values
-        returnprivate_args = self.arg_vars[1:]
-        for callprivate_return_var, returnprivate_arg in zip(callprivate_return_vars, returnprivate_args):
-            state.registers[callprivate_return_var] = state.registers[returnprivate_arg]
+        registers = state.registers
+        for callprivate_return_var, returnprivate_arg in zip(callprivate_return_vars, self._returnprivate_args):
+            registers[callprivate_return_var] = registers[returnprivate_arg]
 
         state.pc = saved_return_pc
 
-        return [state]
+        return state.self_list
 
 
 class TAC_Phi(TAC_Statement):
@@ -90,15 +136,37 @@ class TAC_Phi(TAC_Statement):
         return [state]
 
 
+def _make_const_handler(stmt: "TAC_Const", res_var: str, res_val):
+    """
+    Build the handler of a CONST statement, with its (static) register and value bound as closure variables.
+    NOTE: the bookkeeping of handler_without_side_effects is inlined here, CONST has no args to bind.
+    """
+    def handle(state: SymbolicEVMState):
+        state.trace.append(stmt)
+        state.instruction_count += 1
+
+        state.registers[res_var] = res_val
+        state.set_next_pc()
+        return state.self_list
+
+    return handle
+
+
 class TAC_Const(TAC_Statement):
     __internal_name__ = "CONST"
     __aliases__ = {}
 
-    @TAC_Statement.handler_without_side_effects
-    def handle(self, state: SymbolicEVMState):
-        state.registers[self.res1_var] = self.res1_val
-        state.set_next_pc()
-        return [state]
+    def process_args(self):
+        super().process_args()
+        # CONST always writes the same value to the same register, specialize its handler
+        if self.num_ress > 0:
+            self.handle = _make_const_handler(self, self.res1_var, self.res1_val)
+
+    def copy(self, alias_arg_map=None):
+        _copy = super().copy(alias_arg_map)
+        if _copy.res_vars:
+            _copy.handle = _make_const_handler(_copy, _copy.res1_var, _copy.res1_val)
+        return _copy
 
 
 class TAC_Nop(TAC_Statement):
@@ -107,7 +175,7 @@ class TAC_Nop(TAC_Statement):
     # @TAC_Statement.handler_without_side_effects
     def handle(self, state: SymbolicEVMState):
         state.set_next_pc()
-        return [state]
+        return state.self_list
 
 
 class TAC_Callprivateargs(TAC_Statement):
@@ -115,4 +183,4 @@ class TAC_Callprivateargs(TAC_Statement):
 
     def handle(self, state: SymbolicEVMState):
         state.set_next_pc()
-        return [state]
+        return state.self_list
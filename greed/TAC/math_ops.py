@@ -22,7 +22,13 @@ class TAC_Add(TAC_Statement):
 
     @TAC_Statement.handler_without_side_effects
     def handle(self, state: SymbolicEVMState):
-        state.registers[self.res1_var] = BV_Add(self.arg1_val, self.arg2_val)
+        # Adding a concrete zero, just reuse the other operand
+        if is_concrete(self.arg1_val) and bv_unsigned_value(self.arg1_val) == 0:
+            state.registers[self.res1_var] = self.arg2_val
+        elif is_concrete(self.arg2_val) and bv_unsigned_value(self.arg2_val) == 0:
+            state.registers[self.res1_var] = self.arg1_val
+        else:
+            state.registers[self.res1_var] = BV_Add(self.arg1_val, self.arg2_val)
 
         state.set_next_pc()
         return [state]
@@ -34,7 +40,11 @@ class TAC_Sub(TAC_Statement):
 
     @TAC_Statement.handler_without_side_effects
     def handle(self, state: SymbolicEVMState):
-        state.registers[self.res1_var] = BV_Sub(self.arg1_val, self.arg2_val)
+        # Subtracting a concrete zero, just reuse the first operand
+        if is_concrete(self.arg2_val) and bv_unsigned_value(self.arg2_val) == 0:
+            state.registers[self.res1_var] = self.arg1_val
+        else:
+            state.registers[self.res1_var] = BV_Sub(self.arg1_val, self.arg2_val)
 
         state.set_next_pc()
         return [state]
@@ -46,7 +56,27 @@ class TAC_Mul(TAC_Statement):
 
     @TAC_Statement.handler_without_side_effects
     def handle(self, state: SymbolicEVMState):
-        state.registers[self.res1_var] = BV_Mul(self.arg1_val, self.arg2_val)
+        if is_concrete(self.arg1_val) or is_concrete(self.arg2_val):
+            # At least one concrete operand, we can do a trick to simplify
+            if is_concrete(self.arg1_val):
+                conc, sym = self.arg1_val, self.arg2_val
+            else:
+                conc, sym = self.arg2_val, self.arg1_val
+            conc_val = bv_unsigned_value(conc)
+
+            if conc_val == 0:
+                state.registers[self.res1_var] = BVV(0, 256)
+            elif conc_val == 1:
+                state.registers[self.res1_var] = sym
+            elif is_pow2(conc_val):
+                # NOTE: bit_length is O(1), utils.extra.log2 shifts one bit at a time
+                state.registers[self.res1_var] = BV_Shl(sym, BVV(conc_val.bit_length() - 1, 256))
+            elif conc_val == 2 ** 256 - 1:
+                state.registers[self.res1_var] = BV_Sub(BVV(0, 256), sym)
+            else:
+                state.registers[self.res1_var] = BV_Mul(sym, conc)
+        else:
+            state.registers[self.res1_var] = BV_Mul(self.arg1_val, self.arg2_val)
 
         state.set_next_pc()
         return [state]
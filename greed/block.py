@@ -1,8 +1,9 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 import networkx as nx
 
 from greed.TAC import TAC_Statement
+from greed.utils.exceptions import VMNoSuccessors
 
 if TYPE_CHECKING:
     from greed.function import TAC_Function
@@ -44,6 +45,9 @@ class Block(object):
         self._subgraph = None
         self._acyclic_subgraph = None
 
+        # NOTE: built on first use, i.e., after all the fake statements have been injected in the block
+        self._next_statement_at = None
+
     @property
     def succ(self) -> List['Block']:
         """
@@ -54,6 +58,36 @@ class Block(object):
             self._succ = list(self.cfg.graph.successors(self))
         return self._succ
 
+    def next_statement(self, stmt: TAC_Statement) -> Optional[TAC_Statement]:
+        """
+        Args:
+            stmt: A statement in this block
+        Returns:
+            The statement following stmt in this block, or None if stmt is the last one
+        """
+        if self._next_statement_at is None:
+            self._next_statement_at = {s.id: n for s, n in zip(self.statements, self.statements[1:])}
+        return self._next_statement_at.get(stmt.id, None)
+
+    def fallthrough_block(self) -> 'Block':
+        """
+        Returns:
+            The block where the execution continues after the last statement of this block
+        Raises:
+            VMNoSuccessors: If the block has no fallthrough successor
+        """
+        if len(self.succ) == 0:
+            #  case 1: end of the block and no targets
+            raise VMNoSuccessors
+        elif len(self.succ) == 1:
+            #  case 2: end of the block and one target
+            return self.succ[0]
+        elif self.fallthrough_edge is None:
+            raise VMNoSuccessors(f"Block {self} does not have a fallthrough edge.")
+        else:
+            #  case 3: end of the block and more than one target
+            return self.fallthrough_edge
+
     @property
     def pred(self) -> List['Block']:
         """
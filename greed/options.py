@@ -97,3 +97,8 @@ SOLVER_YICES2 = "YICES2"
 SOLVER = SOLVER_YICES2
 
 SOLVER_TIMEOUT = None
+
+# Wether we want every state to remember the satisfiability of its constraints,
+# so that the solver is only queried again after new constraints are added
+# (or a frame is popped), and a copied state does not query the solver again.
+SOLVER_SAT_CACHE = True
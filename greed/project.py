@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import logging
 import time
 from collections import defaultdict
@@ -50,6 +50,15 @@ class Project(object):
                 fake_statement = TAC_Callprivateargs(block_id=root_block.id, stmt_id=f"fake_{arg}_{_counter}", defs=[arg])
                 root_block.statements.insert(0, fake_statement)
                 self.statement_at[fake_statement.id] = fake_statement
+
+        # resolve the (static) CALLPRIVATE targets once, instead of on every call
+        # (the others, e.g., in blocks outside any function CFG, are resolved every time they are executed)
+        for statement in self.statement_at.values():
+            if not isinstance(statement, TAC_Callprivate) or self._callprivate_target(statement) is None:
+                continue
+            if self.factory.block(statement.block_id).cfg is None:
+                continue
+            statement.resolve_static_call(self)
         
         # Do we have an official abi?
         self.abi = self.tac_parser.parse_abi()
@@ -67,6 +76,21 @@ class Project(object):
 
         self.sanity_check()
 
+    def _callprivate_target(self, statement: TAC_Callprivate) -> Optional[TAC_Function]:
+        """
+        Returns the target function of a CALLPRIVATE statement (or None if the target is not known).
+        """
+        if not hasattr(statement, "arg1_val") or statement.arg1_val is None:
+            return None
+
+        target_block = self.factory.block(hex(statement.arg1_val.value))
+        if target_block is None:
+            return None
+
+        target_function = target_block.function
+        assert target_function is not None, f"Target block {target_block.id} of CALLPRIVATE statement {statement.id} has no function"
+        return target_function
+
     @property
     def w3(self):
         if self._w3 is None:
@@ -102,18 +126,11 @@ class Project(object):
         # Find the target function for each CALLPRIVATE statement
         callprivate_statements_with_target: List[Tuple[TAC_Callprivate, TAC_Function]] = []
         for statement in callprivate_statements:
-            if not hasattr(statement, "arg1_val") or statement.arg1_val is None:
-                log.debug(f"CALLPRIVATE statement {statement.id} has no known target function")
-                continue
-
-            target_block = self.factory.block(hex(statement.arg1_val.value))
-            if target_block is None:
+            target_function = self._callprivate_target(statement)
+            if target_function is None:
                 log.debug(f"CALLPRIVATE statement {statement.id} has no known target function")
                 continue
 
-            target_function = target_block.function
-            assert target_function is not None, f"Target block {target_block.id} of CALLPRIVATE statement {statement.id} has no function"
-
             callprivate_statements_with_target.append((statement, target_function))
         
         # Check that the number of arguments is correct
@@ -202,7 +202,8 @@ class SimulationManager:
         Raises:
             Exception: If something goes wrong while generating the successors
         """
-        log.debug(f"Stepping {state}")
+        # NOTE: lazy formatting, this is executed for every statement
+        log.debug("Stepping %s", state)
         log.debug(state.curr_stmt)
 
         # Some inspect capabilities, uses the plugin.
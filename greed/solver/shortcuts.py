@@ -56,7 +56,10 @@ def concretize(state, val, force=False):
     else:
         try:
             val_sol = state.solver.eval(val, raw=True)
-            if state.solver.is_formula_true(Equal(val, val_sol)):
+            if not val.has_vars:
+                # no symbols in the term: the solution is the only possible one
+                return val_sol
+            elif state.solver.is_formula_true(Equal(val, val_sol)):
                 # one possible solution
                 return val_sol
             elif force is True:
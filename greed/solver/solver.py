@@ -1,6 +1,6 @@
 import logging
 import threading
-from typing import List, TypeVar
+from typing import List, Optional, Tuple, TypeVar
 
 from greed import options
 from greed.utils.exceptions import SolverTimeout
@@ -10,8 +10,11 @@ from yices.YicesException import YicesException
 log = logging.getLogger(__name__)
 
 class Term:
+    __slots__ = ()
+
     children: List['Term']
     operator: str
+    has_vars: bool
 
     def dump_smt2(self) -> str:
         """
@@ -35,15 +38,17 @@ class Term:
 
 
 class BoolTerm(Term):
-    pass
+    __slots__ = ()
 
 class BVTerm(Term):
+    __slots__ = ()
+
     @property
     def bitsize(self):
         raise NotImplementedError()
 
 class ArrayTerm(Term):
-    pass
+    __slots__ = ()
 
 class Sort:
     pass
@@ -129,6 +134,15 @@ class Solver:
         """
         raise Exception("Not implemented")
 
+    def as_upper_bound(self, formula: BoolTerm) -> Optional[Tuple[BVTerm, int]]:
+        """
+        If the given formula is a concrete unsigned upper bound on a bitvector (i.e., x < c or x <= c),
+        return the bitvector and the (inclusive) bound, otherwise return None.
+        Args:
+            formula: The formula to check
+        """
+        raise Exception("Not implemented")
+
     def is_sat(self, ) -> bool:
         """
         Return True if the solver is in a satisfiable state.
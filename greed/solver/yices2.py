@@ -1,5 +1,6 @@
+import functools
 import re
-from typing import List
+from typing import List, Optional, Tuple
 
 import yices
 
@@ -11,14 +12,25 @@ Solver interface implementation for Yices2, refer to the Solver interface for do
 
 
 class YicesTerm(Term):
-    def __init__(self, yices_id, operator=None, children=None, name=None, value=None):
+    # terms are allocated on every operation, keep their attributes in slots
+    __slots__ = ("id", "name", "_value", "children", "num_children", "operator", "is_simplified", "_is_concrete",
+                 "has_vars", "__weakref__")
+
+    def __init__(self, yices_id, operator=None, children=None, name=None, value=None, is_simplified=False,
+                 has_vars=None):
         self.id = yices_id
         self.name = name
         self._value = value
         self.children = children if children else []
         self.num_children = len(self.children)
         self.operator = operator
-        self.is_simplified = False
+        self.is_simplified = is_simplified
+        # terms are immutable, so concreteness is checked (at most) once
+        self._is_concrete = True if operator == "bvv" else None
+        # structural flag: whether the term references any symbol (known at construction time)
+        if has_vars is None:
+            has_vars = any(child.has_vars for child in self.children if isinstance(child, YicesTerm))
+        self.has_vars = has_vars
 
     @property
     def value(self):
@@ -74,6 +86,7 @@ class YicesTerm(Term):
 
 
 class YicesTermBool(BoolTerm, YicesTerm):
+    __slots__ = ()
 
     def dump_smt2(self):
 
@@ -110,6 +123,8 @@ class YicesTermBool(BoolTerm, YicesTerm):
 
 
 class YicesTermBV(BVTerm, YicesTerm):
+    __slots__ = ()
+
     @property
     def bitsize(self):
         return yices.Terms.bitsize(self.id)
@@ -174,6 +189,8 @@ class YicesTermBV(BVTerm, YicesTerm):
 
 
 class YicesTermArray(ArrayTerm, YicesTerm):
+    __slots__ = ()
+
     def dump_smt2(self):
         if self.operator == "array":
             # NOTE: We're going to ignore arg 0 (the name) for now --
@@ -247,14 +264,20 @@ class Yices2(Solver):
     def BVV(self, value: int, width: int) -> YicesTermBV:
         assert isinstance(value, int), f"Expected type int, got {type(value)}"
         assert isinstance(width, int), f"Expected type int, got {type(width)}"
+        return Yices2._BVV(value, width)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2**16)
+    def _BVV(value: int, width: int) -> YicesTermBV:
+        # constants are immutable and used over and over (e.g., BVV(0, 256)),
+        # so the same term is shared instead of parsing a new one on every call
         # IMPORTANT: bvconst_integer under the hood calls yices_bvconst_int64 and overflows so we cannot use it
         # yices_id = yices.Terms.bvconst_integer(width, value)
+        value = value % (2**width)
         yices_id = yices.Terms.parse_bvbin(
-            format(value % (2**width), f"#0{width+2}b")[2:]
+            format(value, f"#0{width+2}b")[2:]
         )
-        res = YicesTermBV(operator="bvv", yices_id=yices_id, value=value)
-        res.is_simplified = True
-        return res
+        return YicesTermBV(operator="bvv", yices_id=yices_id, value=value, is_simplified=True)
 
     def BVS(self, symbol: str, width: int) -> YicesTermBV:
         assert isinstance(symbol, str), f"Expected type str, got {type(symbol)}"
@@ -263,7 +286,7 @@ class Yices2(Solver):
         yices_id = yices.Terms.new_uninterpreted_term(
             self.BVSort(width).id, name=symbol
         )
-        return YicesTermBV(operator="bvs", yices_id=yices_id, name=symbol)
+        return YicesTermBV(operator="bvs", yices_id=yices_id, name=symbol, has_vars=True)
 
     def bv_unsigned_value(self, bv: YicesTermBV) -> int:
         assert isinstance(bv, YicesTermBV), f"Expected type YicesTermBV, got {type(bv)}"
@@ -271,20 +294,36 @@ class Yices2(Solver):
             bv
         ), "Invalid bv_unsigned_value of non constant bitvector"
 
-        # works, but yices.Terms.bv_const_value(bv) could be a cleaner (though slower) option
-        res_str = yices.Terms.to_string(bv.id, width=-1)
-        return int(res_str[2:], 2)
+        # .value is parsed from yices (only once) unless it is already known
+        return bv.value
 
     def get_bv_by_name(self, symbol):
         id = yices.Terms.get_by_name(symbol)
         if id is None:
             return None
         else:
-            return YicesTermBV(operator="bvs", yices_id=id, name=symbol)
+            return YicesTermBV(operator="bvs", yices_id=id, name=symbol, has_vars=True)
 
     def is_concrete(self, bv: YicesTermBV) -> bool:
         assert isinstance(bv, YicesTermBV), f"Expected type YicesTermBV, got {type(bv)}"
-        return yices.Terms.constructor(bv.id) == yices.Constructor.BV_CONSTANT
+        if bv._is_concrete is None:
+            bv._is_concrete = yices.Terms.constructor(bv.id) == yices.Constructor.BV_CONSTANT
+        return bv._is_concrete
+
+    def as_upper_bound(self, formula: YicesTermBool) -> Optional[Tuple[YicesTermBV, int]]:
+        assert isinstance(formula, YicesTermBool), f"Expected type YicesTermBool, got {type(formula)}"
+        if formula.operator not in ("bvult", "bvule"):
+            return None
+        bv, limit = formula.children
+        if not self.is_concrete(limit):
+            return None
+        bound = self.bv_unsigned_value(limit)
+        if formula.operator == "bvult":
+            if bound == 0:
+                # x < 0 is UNSAT, not a bound
+                return None
+            bound -= 1
+        return bv, bound
 
     @Solver.solver_timeout
     def is_sat(self) -> bool:
@@ -369,6 +408,7 @@ class Yices2(Solver):
             children=[symbol, index_sort, value_sort],
             yices_id=yices_id,
             name=symbol,
+            has_vars=True,
         )
 
     # CONDITIONAL OPERATIONS
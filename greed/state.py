@@ -32,6 +32,7 @@ class SymbolicEVMState:
     memory: LambdaMemory
     options: typing.Dict[str, typing.Any]
     registers: typing.Dict[str, typing.Any]
+    self_list: typing.List["SymbolicEVMState"]
 
     # default plugins
     solver: SimStateSolver
@@ -55,6 +56,10 @@ class SymbolicEVMState:
         self.code = project.code
         self.uuid = SymbolicEVMState.uuid_generator.next()
 
+        # handlers that just step this state return it as their only successor,
+        # keep a single list around instead of allocating it at every statement
+        self.self_list = [self]
+
         if partial_init:
             # this is only used when copying the state
             return
@@ -209,11 +214,11 @@ class SymbolicEVMState:
             VMUnexpectedSuccessors: If the successor does not match any of the expected successors
         """
         try:
-            curr_bb = self.project.factory.block(self.curr_stmt.block_id)
-            stmt_list_idx = curr_bb.statements.index(self.curr_stmt)
-            remaining_stmts = curr_bb.statements[stmt_list_idx + 1:]
-            if remaining_stmts:
-                self.pc = remaining_stmts[0].id
+            curr_stmt = self.curr_stmt
+            curr_bb = self.project.factory.block(curr_stmt.block_id)
+            next_stmt = curr_bb.next_statement(curr_stmt)
+            if next_stmt is not None:
+                self.pc = next_stmt.id
             else:
                 self.pc = self.get_fallthrough_pc()
         except VMNoSuccessors:
@@ -227,21 +232,13 @@ class SymbolicEVMState:
         """
         curr_bb = self.project.factory.block(self.curr_stmt.block_id)
 
-        if len(curr_bb.succ) == 0:
-            #  case 1: end of the block and no targets
+        try:
+            fallthrough_bb = curr_bb.fallthrough_block()
+        except VMNoSuccessors:
             log.debug("Next stmt is NONE")
-            raise VMNoSuccessors
-        elif len(curr_bb.succ) == 1:
-            #  case 2: end of the block and one target
-            log.debug("Next stmt is {}".format(curr_bb.succ[0].first_ins.id))
-            return curr_bb.succ[0].first_ins.id
-        elif curr_bb.fallthrough_edge is None:
-            raise VMNoSuccessors(f"Block {curr_bb} does not have a fallthrough edge.")
-        else:
-            #  case 3: end of the block and more than one target
-            fallthrough_bb = curr_bb.fallthrough_edge
-            log.debug("Next stmt is {}".format(fallthrough_bb.first_ins.id))
-            return fallthrough_bb.first_ins.id
+            raise
+        log.debug("Next stmt is {}".format(fallthrough_bb.first_ins.id))
+        return fallthrough_bb.first_ins.id
 
     def get_non_fallthrough_pc(self, destination_val):
         """
@@ -22,6 +22,8 @@ class SimStateSolver(SimStatePlugin):
     _curr_frame_level: int
     _path_constraints: Dict[int, Set[BoolTerm]]
     _memory_constraints: Dict[int, Set[BoolTerm]]
+    _path_upper_bounds: Dict[int, Dict[BVTerm, int]]
+    _status: Optional[bool]
 
     def __init__(self, partial_init=False):
         super(SimStateSolver, self).__init__()
@@ -45,9 +47,15 @@ class SimStateSolver(SimStatePlugin):
         # Keep constraints organized in frames
         self._path_constraints = dict()
         self._memory_constraints = dict()
+        # Tightest (inclusive) concrete upper bound of the terms constrained by the path constraints
+        self._path_upper_bounds = dict()
 
         self._path_constraints[0] = set()
         self._memory_constraints[0] = set()
+        self._path_upper_bounds[0] = dict()
+
+        # Known satisfiability of the asserted constraints (True: SAT, False: UNSAT, None: needs a search)
+        self._status = True
 
     def _add_assertion(self, assertion: BoolTerm):
         """
@@ -55,6 +63,7 @@ class SimStateSolver(SimStatePlugin):
         Args:
             assertion: The constraint to add.
         """
+        self._status = None
         self._solver.add_assertion(assertion)
 
     def _add_assertions(self, assertions: List[BoolTerm]):
@@ -63,6 +72,7 @@ class SimStateSolver(SimStatePlugin):
         Args:
             assertions: The constraints to add.
         """
+        self._status = None
         self._solver.add_assertions(assertions)
 
     def push(self) -> int:
@@ -72,6 +82,7 @@ class SimStateSolver(SimStatePlugin):
         self._curr_frame_level += 1
         self._path_constraints[self._curr_frame_level] = set()
         self._memory_constraints[self._curr_frame_level] = set()
+        self._path_upper_bounds[self._curr_frame_level] = dict()
         self._solver.push()
         return self._curr_frame_level
 
@@ -85,7 +96,9 @@ class SimStateSolver(SimStatePlugin):
         else:
             del self._path_constraints[self._curr_frame_level]
             del self._memory_constraints[self._curr_frame_level]
+            del self._path_upper_bounds[self._curr_frame_level]
             self._curr_frame_level -= 1
+            self._status = None
             self._solver.pop()
             return self._curr_frame_level
 
@@ -102,9 +115,34 @@ class SimStateSolver(SimStatePlugin):
         Args:
             constraint: The constraint to add.
         """
+        # Terms are hash-consed by the backend, so a repeated constraint (e.g., the same check in a loop body)
+        # has the same id: if it is already active at any frame, there is no need to assert it again.
+        for frame_constraints in self._path_constraints.values():
+            if constraint in frame_constraints:
+                return
+
+        # Range constraints on the same term (e.g., the bound re-added at every loop iteration) are merged:
+        # a bound that is looser than the current one is already implied, and there is no need to assert it.
+        upper_bound = self._solver.as_upper_bound(constraint)
+        if upper_bound is not None:
+            term, bound = upper_bound
+            current_bound = self._upper_bound_of(term)
+            if current_bound is not None and current_bound <= bound:
+                return
+            self._path_upper_bounds[self._curr_frame_level][term] = bound
+
         self._path_constraints[self._curr_frame_level].add(constraint)
         self._add_assertion(constraint)
 
+    def _upper_bound_of(self, term: BVTerm) -> Optional[int]:
+        """
+        Returns the tightest active upper bound of a term (or None if the term is not bounded).
+        Args:
+            term: The bounded term.
+        """
+        bounds = [frame_bounds[term] for frame_bounds in self._path_upper_bounds.values() if term in frame_bounds]
+        return min(bounds) if bounds else None
+
     def add_memory_constraint(self, constraint: BoolTerm):
         """
         Add a memory constraint to the state (at the current frame level).
@@ -210,8 +248,8 @@ class SimStateSolver(SimStatePlugin):
                 # TODO this assumes implementation-specific knowledge (Yices2) (i.e., the name)
                 symbols[constraint.name] = constraint
             else:
-                # we found something else, just queue its children
-                queue.extend(constraint.children)
+                # we found something else, just queue its children (skipping the ones without any symbol)
+                queue.extend(child for child in constraint.children if isinstance(child, Term) and child.has_vars)
 
         return list(symbols.values())
 
@@ -232,13 +270,35 @@ class SimStateSolver(SimStatePlugin):
         """
         Check if the solver is in a satisfiable state.
         """
-        return self._solver.is_sat()
+        if not options.SOLVER_SAT_CACHE:
+            return self._solver.is_sat()
+
+        # nothing was asserted (or popped) since the last definitive answer
+        if self._status is not None:
+            return self._status
+
+        sat = self._solver.is_sat()
+        if sat:
+            # NOTE: only SAT is remembered, not SAT could also be UNKNOWN
+            self._status = True
+        return sat
 
     def is_unsat(self) -> bool:
         """
         Check if the solver is in an unsatisfiable state.
         """
-        return self._solver.is_unsat()
+        if not options.SOLVER_SAT_CACHE:
+            return self._solver.is_unsat()
+
+        # nothing was asserted (or popped) since the last definitive answer
+        if self._status is not None:
+            return not self._status
+
+        unsat = self._solver.is_unsat()
+        if unsat:
+            # NOTE: only UNSAT is remembered, not UNSAT could also be UNKNOWN
+            self._status = False
+        return unsat
 
     def is_formula_sat(self, formula: BoolTerm) -> bool:
         """
@@ -343,6 +403,7 @@ class SimStateSolver(SimStatePlugin):
         new_solver._curr_frame_level = 0
         new_solver._path_constraints = dict()
         new_solver._memory_constraints = dict()
+        new_solver._path_upper_bounds = dict()
 
         # Re-add all the constraints (Maybe one day Yices2 will do it for us with
         # a full Context clone, as of now this is the "cloning dei poveri".
@@ -352,6 +413,7 @@ class SimStateSolver(SimStatePlugin):
             new_solver._add_assertions(new_solver._path_constraints[level])
             new_solver._memory_constraints[level] = set(self._memory_constraints[level])
             new_solver._add_assertions(new_solver._memory_constraints[level])
+            new_solver._path_upper_bounds[level] = dict(self._path_upper_bounds[level])
 
             if new_solver._curr_frame_level == self._curr_frame_level:
                 break
@@ -359,6 +421,9 @@ class SimStateSolver(SimStatePlugin):
                 # Add the next frame
                 new_solver.push()
 
+        # same constraints, same satisfiability (even if the new backend context was never checked)
+        new_solver._status = self._status
+
         return new_solver
 
     def dump_smt2(self, filename: str):
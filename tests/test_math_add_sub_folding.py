@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+import os
+
+import IPython
+
+from greed import Project
+from greed.solver.shortcuts import *
+
+if __package__:
+    from . import common
+else:
+    import common
+
+
+DEBUG = False
+
+
+def find_statement(p, name):
+    # the statement must read both operands from the registers (no static values)
+    return next(s for s in p.statement_at.values()
+                if s.__internal_name__ == name and all(v is None for v in s.raw_arg_vals.values()))
+
+
+def execute(p, stmt, arg1, arg2):
+    state = p.factory.entry_state(xid=1)
+    state.pc = stmt.id
+    state.registers[stmt.arg1_var] = arg1
+    state.registers[stmt.arg2_var] = arg2
+
+    succ, = stmt.handle(state)
+    return succ, succ.registers[stmt.res1_var]
+
+
+def run_test(target_dir, debug=False):
+    p = Project(target_dir=target_dir)
+
+    add_stmt = find_statement(p, "ADD")
+    sub_stmt = find_statement(p, "SUB")
+
+    x = BVS("x", 256)
+    zero = BVV(0, 256)
+
+    # x + 0 and 0 + x just reuse x
+    for arg1, arg2 in [(x, zero), (zero, x)]:
+        state, res = execute(p, add_stmt, arg1, arg2)
+        assert res == x
+        assert state.solver.is_formula_true(Equal(res, BV_Add(arg1, arg2)))
+
+    # x - 0 just reuses x
+    state, res = execute(p, sub_stmt, x, zero)
+    assert res == x
+    assert state.solver.is_formula_true(Equal(res, BV_Sub(x, zero)))
+
+    # 0 - x is not folded
+    state, res = execute(p, sub_stmt, zero, x)
+    assert res.operator == "bvsub"
+    assert state.solver.is_formula_true(Equal(res, BV_Sub(zero, x)))
+    assert not state.solver.is_formula_true(Equal(res, x))
+
+    # non-zero operands still build the operation
+    state, res = execute(p, add_stmt, x, BVV(1, 256))
+    assert res.operator == "bvadd"
+    assert state.solver.is_formula_true(Equal(res, BV_Add(x, BVV(1, 256))))
+    state, res = execute(p, sub_stmt, x, BVV(1, 256))
+    assert res.operator == "bvsub"
+    assert state.solver.is_formula_true(Equal(res, BV_Sub(x, BVV(1, 256))))
+
+    # concrete operands (including 0 - 1, which wraps around 2**256)
+    for a, b in [(0, 0), (0, 1), (1, 0), (5, 3), (2 ** 256 - 1, 1)]:
+        _, res = execute(p, add_stmt, BVV(a, 256), BVV(b, 256))
+        assert is_concrete(res) and bv_unsigned_value(res) == (a + b) % 2 ** 256, f"{hex(a)} + {hex(b)}"
+        _, res = execute(p, sub_stmt, BVV(a, 256), BVV(b, 256))
+        assert is_concrete(res) and bv_unsigned_value(res) == (a - b) % 2 ** 256, f"{hex(a)} - {hex(b)}"
+
+    if debug:
+        IPython.embed()
+
+
+def test_math_add_sub_folding():
+    run_test(target_dir=f"{os.path.dirname(__file__)}/test_math",
+             debug=DEBUG)
+
+
+if __name__ == "__main__":
+    common.setup_logging()
+    args = common.parse_args()
+
+    DEBUG = args.debug
+    test_math_add_sub_folding()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import os
+
+import IPython
+
+from greed import Project
+from greed.solver.shortcuts import *
+
+if __package__:
+    from . import common
+else:
+    import common
+
+
+DEBUG = False
+
+# concrete operands that MUL folds into cheaper terms (0, 1, powers of 2, -1), and a couple that it does not
+FOLDED_CONSTANTS = [0, 1, 2, 2 ** 8, 2 ** 255, 2 ** 256 - 1, 3, 0xdeadbeef]
+
+
+def execute_mul(p, mul_stmt, arg1, arg2):
+    state = p.factory.entry_state(xid=1)
+    state.pc = mul_stmt.id
+    state.registers[mul_stmt.arg1_var] = arg1
+    state.registers[mul_stmt.arg2_var] = arg2
+
+    succ, = mul_stmt.handle(state)
+    return succ, succ.registers[mul_stmt.res1_var]
+
+
+def run_test(target_dir, debug=False):
+    p = Project(target_dir=target_dir)
+
+    mul_stmt = next(s for s in p.statement_at.values() if s.__internal_name__ == "MUL")
+
+    # symbolic * concrete (both operand orders) must be equivalent to the plain multiplication
+    for c in FOLDED_CONSTANTS:
+        x = BVS("x", 256)
+        for arg1, arg2 in [(x, BVV(c, 256)), (BVV(c, 256), x)]:
+            state, res = execute_mul(p, mul_stmt, arg1, arg2)
+            assert state.solver.is_formula_true(Equal(res, BV_Mul(x, BVV(c, 256)))), f"x * {hex(c)} folded incorrectly"
+
+    # concrete * concrete must stay concrete and wrap around 2**256
+    for a in FOLDED_CONSTANTS:
+        for b in [0, 1, 5, 2 ** 128, 2 ** 256 - 1]:
+            _, res = execute_mul(p, mul_stmt, BVV(a, 256), BVV(b, 256))
+            assert is_concrete(res), f"{hex(a)} * {hex(b)} is not concrete"
+            assert bv_unsigned_value(res) == (a * b) % 2 ** 256, f"{hex(a)} * {hex(b)} folded incorrectly"
+
+    if debug:
+        IPython.embed()
+
+
+def test_math_mul_folding():
+    run_test(target_dir=f"{os.path.dirname(__file__)}/test_math",
+             debug=DEBUG)
+
+
+if __name__ == "__main__":
+    common.setup_logging()
+    args = common.parse_args()
+
+    DEBUG = args.debug
+    test_math_mul_folding()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import os
+
+import IPython
+
+from greed import Project
+from greed.solver.shortcuts import *
+
+if __package__:
+    from . import common
+else:
+    import common
+
+
+DEBUG = False
+
+
+def run_test(target_dir, debug=False):
+    p = Project(target_dir=target_dir)
+
+    x = BVS("x", 256)
+    c = BVV(42, 256)
+
+    # symbols and constants
+    assert x.has_vars
+    assert not c.has_vars
+    assert BV_Add(x, c).has_vars
+    assert not BV_Add(c, c).has_vars
+
+    # BV_Extract also has the (int) bounds as children
+    assert BV_Extract(0, 7, x).has_vars
+    assert not BV_Extract(0, 7, c).has_vars
+
+    # If
+    assert If(Equal(x, c), c, BVV(0, 256)).has_vars
+    assert If(Equal(c, c), x, c).has_vars
+    assert not If(Equal(c, BVV(0, 256)), c, BVV(0, 256)).has_vars
+
+    # arrays are symbols
+    arr = Array("arr", BVSort(256), BVSort(256))
+    assert arr.has_vars
+    assert Array_Store(arr, c, c).has_vars
+    assert Array_Select(arr, c).has_vars
+    assert Array_Select(Array_Store(arr, c, c), c).has_vars
+
+    # model values are constants
+    state = p.factory.entry_state(xid=1)
+    state.add_constraint(Equal(x, c))
+    x_sol = state.solver.eval(x, raw=True)
+    assert not x_sol.has_vars
+    assert bv_unsigned_value(x_sol) == 42
+
+    # concretize a symbol-free term that is not a constant: yices folds every symbol-free operation,
+    # so pretend it did not fold this one
+    state = p.factory.entry_state(xid=1)
+    state.add_constraint(BV_ULT(x, BVV(10, 256)))
+    term = BV_Add(c, BVV(1, 256))
+    term._is_concrete = False
+    assert not is_concrete(term) and not term.has_vars
+    val = concretize(state, term)
+    assert is_concrete(val) and bv_unsigned_value(val) == 43
+
+    # a symbolic term with multiple solutions is not concretized, unless forced
+    state = p.factory.entry_state(xid=1)
+    state.add_constraint(BV_ULT(x, BVV(10, 256)))
+    assert concretize(state, BV_Add(x, c)) is None
+    val = concretize(state, BV_Add(x, c), force=True)
+    assert is_concrete(val) and 42 <= bv_unsigned_value(val) < 52
+    assert state.solver.is_formula_true(Equal(BV_Add(x, c), val))
+
+    # a symbolic term with a single solution is concretized
+    state = p.factory.entry_state(xid=1)
+    state.add_constraint(Equal(x, BVV(3, 256)))
+    val = concretize(state, BV_Add(x, c))
+    assert is_concrete(val) and bv_unsigned_value(val) == 45
+
+    if debug:
+        IPython.embed()
+
+
+def test_solver_has_vars():
+    run_test(target_dir=f"{os.path.dirname(__file__)}/test_math",
+             debug=DEBUG)
+
+
+if __name__ == "__main__":
+    common.setup_logging()
+    args = common.parse_args()
+
+    DEBUG = args.debug
+    test_solver_has_vars()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import os
+
+import IPython
+
+from greed import Project
+from greed import options
+from greed.solver.shortcuts import *
+
+if __package__:
+    from . import common
+else:
+    import common
+
+
+DEBUG = False
+
+
+def check(state):
+    return state.solver.is_sat(), state.solver.is_unsat()
+
+
+def run_scenario(p):
+    """
+    Run the same sequence of solver operations, returning the satisfiability after each one.
+    """
+    x = BVS("x", 256)
+    y = BVS("y", 256)
+    answers = []
+
+    state = p.factory.entry_state(xid=1)
+    answers.append(check(state))
+
+    state.add_constraint(BV_ULT(x, BVV(10, 256)))
+    answers.append(check(state))
+    answers.append(check(state))
+
+    # UNSAT frame
+    state.solver.push()
+    state.add_constraint(BV_UGT(x, BVV(20, 256)))
+    answers.append(check(state))
+    answers.append(check(state))
+
+    # copies of a SAT and of an UNSAT state
+    unsat_copy = state.copy()
+    answers.append(check(unsat_copy))
+    unsat_copy.solver.pop()
+    answers.append(check(unsat_copy))
+
+    state.solver.pop()
+    answers.append(check(state))
+
+    sat_copy = state.copy()
+    answers.append(check(sat_copy))
+    sat_copy.add_constraint(Equal(x, y))
+    sat_copy.solver.add_memory_constraint(Equal(y, BVV(42, 256)))
+    answers.append(check(sat_copy))
+    answers.append(check(state))
+
+    return answers
+
+
+def run_test(target_dir, debug=False):
+    p = Project(target_dir=target_dir)
+
+    old_sat_cache = options.SOLVER_SAT_CACHE
+    try:
+        # remembering the satisfiability must not change any answer
+        options.SOLVER_SAT_CACHE = False
+        uncached_answers = run_scenario(p)
+        options.SOLVER_SAT_CACHE = True
+        cached_answers = run_scenario(p)
+        assert cached_answers == uncached_answers, f"{cached_answers} != {uncached_answers}"
+        assert uncached_answers == [(True, False), (True, False), (True, False), (False, True), (False, True),
+                                    (False, True), (True, False), (True, False), (True, False), (False, True),
+                                    (True, False)]
+
+        # the backend is only queried again after a new constraint
+        state = p.factory.entry_state(xid=1)
+        backend_checks = []
+        backend_is_sat = state.solver._solver.is_sat
+        state.solver._solver.is_sat = lambda: backend_checks.append(True) or backend_is_sat()
+        state.add_constraint(BV_ULT(BVS("x", 256), BVV(10, 256)))
+        assert state.solver.is_sat() and state.solver.is_sat()
+        assert len(backend_checks) == 1
+        state.add_constraint(BV_UGT(BVS("x", 256), BVV(5, 256)))
+        assert state.solver.is_sat()
+        assert len(backend_checks) == 2
+    finally:
+        options.SOLVER_SAT_CACHE = old_sat_cache
+
+    if debug:
+        IPython.embed()
+
+
+def test_solver_sat_cache():
+    run_test(target_dir=f"{os.path.dirname(__file__)}/test_math",
+             debug=DEBUG)
+
+
+if __name__ == "__main__":
+    common.setup_logging()
+    args = common.parse_args()
+
+    DEBUG = args.debug
+    test_solver_sat_cache()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import os
+
+import IPython
+
+from greed import Project
+from greed.solver.shortcuts import *
+
+if __package__:
+    from . import common
+else:
+    import common
+
+
+DEBUG = False
+
+
+def added_path_constraints(state, initial_constraints):
+    return set(state.solver.path_constraints) - initial_constraints
+
+
+def run_test(target_dir, debug=False):
+    p = Project(target_dir=target_dir)
+
+    x = BVS("x", 256)
+
+    # a looser bound is implied by the current one (x < 20 after x < 10), it is not asserted
+    state = p.factory.entry_state(xid=1)
+    initial_constraints = set(state.solver.path_constraints)
+    state.add_constraint(BV_ULT(x, BVV(10, 256)))
+    state.add_constraint(BV_ULT(x, BVV(20, 256)))
+    assert added_path_constraints(state, initial_constraints) == {BV_ULT(x, BVV(10, 256))}
+    assert state.solver.is_sat()
+    assert state.solver.is_formula_true(BV_ULT(x, BVV(10, 256)))
+    assert state.solver.is_formula_sat(Equal(x, BVV(9, 256)))
+
+    # a tighter bound is asserted (x < 5 after x <= 10)
+    state = p.factory.entry_state(xid=1)
+    initial_constraints = set(state.solver.path_constraints)
+    state.add_constraint(BV_ULE(x, BVV(10, 256)))
+    state.add_constraint(BV_ULT(x, BVV(5, 256)))
+    assert added_path_constraints(state, initial_constraints) == {BV_ULE(x, BVV(10, 256)), BV_ULT(x, BVV(5, 256))}
+    assert state.solver.is_sat()
+    assert state.solver.is_formula_true(BV_ULT(x, BVV(5, 256)))
+    assert not state.solver.is_formula_sat(Equal(x, BVV(7, 256)))
+
+    # bounds follow the solver frames (push/pop)
+    state = p.factory.entry_state(xid=1)
+    initial_constraints = set(state.solver.path_constraints)
+    state.add_constraint(BV_ULT(x, BVV(10, 256)))
+    state.solver.push()
+    state.add_constraint(BV_ULT(x, BVV(5, 256)))
+    state.add_constraint(BV_ULT(x, BVV(7, 256)))
+    assert added_path_constraints(state, initial_constraints) == {BV_ULT(x, BVV(10, 256)), BV_ULT(x, BVV(5, 256))}
+    assert not state.solver.is_formula_sat(Equal(x, BVV(6, 256)))
+    state.solver.pop()
+    assert added_path_constraints(state, initial_constraints) == {BV_ULT(x, BVV(10, 256))}
+    assert state.solver.is_formula_sat(Equal(x, BVV(6, 256)))
+    # popping the tighter bound makes x < 7 meaningful again
+    state.add_constraint(BV_ULT(x, BVV(7, 256)))
+    assert added_path_constraints(state, initial_constraints) == {BV_ULT(x, BVV(10, 256)), BV_ULT(x, BVV(7, 256))}
+    assert state.solver.is_sat()
+    assert state.solver.is_formula_sat(Equal(x, BVV(6, 256)))
+    assert not state.solver.is_formula_sat(Equal(x, BVV(8, 256)))
+
+    # bounds are copied with the state, and are independent afterwards
+    state = p.factory.entry_state(xid=1)
+    initial_constraints = set(state.solver.path_constraints)
+    state.add_constraint(BV_ULT(x, BVV(10, 256)))
+    state.solver.push()
+    state.add_constraint(BV_ULE(x, BVV(8, 256)))
+    state_copy = state.copy()
+    state_copy.add_constraint(BV_ULT(x, BVV(9, 256)))
+    state_copy.add_constraint(BV_ULT(x, BVV(5, 256)))
+    assert added_path_constraints(state_copy, initial_constraints) == {BV_ULT(x, BVV(10, 256)),
+                                                                       BV_ULE(x, BVV(8, 256)),
+                                                                       BV_ULT(x, BVV(5, 256))}
+    assert state_copy.solver.is_sat()
+    assert not state_copy.solver.is_formula_sat(Equal(x, BVV(6, 256)))
+    assert added_path_constraints(state, initial_constraints) == {BV_ULT(x, BVV(10, 256)), BV_ULE(x, BVV(8, 256))}
+    assert state.solver.is_formula_sat(Equal(x, BVV(6, 256)))
+    state_copy.solver.pop()
+    state_copy.add_constraint(BV_ULT(x, BVV(9, 256)))
+    assert added_path_constraints(state_copy, initial_constraints) == {BV_ULT(x, BVV(10, 256)),
+                                                                       BV_ULT(x, BVV(9, 256))}
+    assert state_copy.solver.is_formula_sat(Equal(x, BVV(8, 256)))
+    assert not state_copy.solver.is_formula_sat(Equal(x, BVV(9, 256)))
+
+    if debug:
+        IPython.embed()
+
+
+def test_solver_upper_bounds():
+    run_test(target_dir=f"{os.path.dirname(__file__)}/test_math",
+             debug=DEBUG)
+
+
+if __name__ == "__main__":
+    common.setup_logging()
+    args = common.parse_args()
+
+    DEBUG = args.debug
+    test_solver_upper_bounds()